@@ -0,0 +1,76 @@
+"""
+Post model for Writer Context Protocol.
+
+Kept in its own module so cached posts pickle as ``posts.Post`` no matter
+how the server is started.
+"""
+import hashlib
+from datetime import datetime
+from typing import Any, Dict
+
+
+class Post:
+    """A blog post with content and metadata, as cached and searched by the writer tool."""
+    
+    __slots__ = ('title', 'url', 'content', 'date', 'subtitle', 'word_count', 'platform', 'platform_name', 'id', '_content_lower', 'date_display')
+    
+    def __init__(self, title, url, content, date=None, subtitle="", platform="", platform_name=""):
+        self.title = title
+        self.url = url
+        self.content = content
+        self.date = date
+        self.subtitle = subtitle
+        self.word_count = len(content.split()) if content else 0
+        self.platform = platform
+        self.platform_name = platform_name
+        
+        # Generate a unique ID for this post based on URL and title
+        self.id = self.make_id(url, title)
+        self._content_lower = None
+        
+        # Format the display date once rather than on every listing
+        self.date_display = date.strftime("%b %d, %Y") if date else "Unknown date"
+    
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content for snippet search, computed once on first use."""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+    
+    @staticmethod
+    def make_id(url: str, title: str) -> str:
+        """Hash a post's URL and title into a 32-character hex ID."""
+        return hashlib.blake2b(f"{url}:{title}".encode(), digest_size=16).hexdigest()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the Post object to a dictionary for serialization."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'url': self.url, 
+            'content': self.content,
+            'date': self.date.isoformat() if self.date else None,
+            'subtitle': self.subtitle,
+            'word_count': self.word_count,
+            'platform': self.platform,
+            'platform_name': self.platform_name
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Post':
+        """Create a Post object from a dictionary."""
+        post = cls(
+            title=data['title'],
+            url=data['url'],
+            content=data['content'],
+            date=datetime.fromisoformat(data['date']) if data.get('date') else None,
+            subtitle=data.get('subtitle', ''),
+            platform=data.get('platform', ''),
+            platform_name=data.get('platform_name', '')
+        )
+        
+        post.id = data.get('id', post.id)
+        post.word_count = data.get('word_count', post.word_count)
+        
+        return post
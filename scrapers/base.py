@@ -4,7 +4,17 @@ Base scraper functionality for Writer Context Protocol.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from io import BytesIO
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+# Namespace used by RSS feeds for the full HTML body of an item
+CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+# lxml options shared by every RSS parser; recover=True keeps the items parsed
+# before any malformed or truncated markup
+FEED_PARSER_OPTIONS = dict(events=("end",), tag="item", resolve_entities=False, recover=True)
 
 
 @dataclass
@@ -23,6 +33,61 @@ class Post:
             self.word_count = len(self.content.split())
 
 
+def iter_feed_items(data: bytes) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Stream the <item> entries of an RSS feed without building the whole tree.
+    
+    Args:
+        data: Raw bytes of the RSS document
+        
+    Yields:
+        Dictionaries with title, link, published and content (HTML) keys
+    """
+    yield from feed_entries(etree.iterparse(BytesIO(data), **FEED_PARSER_OPTIONS))
+
+
+def feed_entries(events: Iterable[Tuple[str, etree._Element]]) -> Iterator[Dict[str, Optional[str]]]:
+    """
+    Turn parser (event, <item>) pairs into feed entries.
+    
+    Args:
+        events: Events from iterparse or XMLPullParser.read_events()
+        
+    Yields:
+        Dictionaries with title, link, published and content (HTML) keys
+    """
+    for _, item in events:
+        entry = read_feed_item(item)
+        # Items cut off by a truncated feed are recovered without their link
+        if entry['link']:
+            yield entry
+
+
+def read_feed_item(item: etree._Element) -> Dict[str, Optional[str]]:
+    """
+    Extract the fields of a parsed RSS <item> and free it from the tree.
+    
+    Args:
+        item: A fully parsed <item> element
+        
+    Returns:
+        Dictionary with title, link, published and content (HTML) keys
+    """
+    entry = {
+        'title': item.findtext('title'),
+        'link': item.findtext('link'),
+        'published': item.findtext('pubDate'),
+        'content': item.findtext(CONTENT_ENCODED) or item.findtext('description'),
+    }
+    
+    # Free the parsed item and any siblings already processed
+    item.clear()
+    while item.getprevious() is not None:
+        del item.getparent()[0]
+    
+    return entry
+
+
 class BaseScraper(ABC):
     """Base class for platform-specific scrapers."""
     
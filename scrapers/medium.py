@@ -2,16 +2,16 @@
 Medium scraper for Writer Context Protocol.
 """
 import logging
-from datetime import datetime
+from email.utils import parsedate_to_datetime
+from itertools import islice
 from typing import List
-import re
 from urllib.parse import urlparse
 
-import feedparser
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from scrapers.base import BaseScraper, Post
+from scrapers.base import BaseScraper, Post, iter_feed_items
 
 logger = logging.getLogger(__name__)
 
@@ -47,34 +47,35 @@ class MediumScraper(BaseScraper):
                 response = await client.get(rss_url)
                 response.raise_for_status()
                 logger.info(f"RSS feed fetched successfully. Status code: {response.status_code}")
-                feed = feedparser.parse(response.text)
-                logger.info(f"Number of entries in feed: {len(feed.entries)}")
         except Exception as e:
             logger.error(f"Error fetching RSS feed: {str(e)}")
             return []
 
+        try:
+            entries = list(islice(iter_feed_items(response.content), self.max_posts))
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Error parsing Medium feed: {str(e)}")
+            return []
+        logger.info(f"Number of entries in feed: {len(entries)}")
+
         posts = []
-        for entry in feed.entries[:self.max_posts]:
+        for entry in entries:
             try:
-                soup = BeautifulSoup(entry.content[0].value, 'html.parser')
+                soup = BeautifulSoup(entry['content'] or '', 'lxml')
                 cleaned_text = self._clean_content(soup.get_text(separator=' ', strip=True))
                 
                 # Parse date
                 pub_date = None
-                if hasattr(entry, 'published'):
+                if entry['published']:
                     try:
                         # RFC 2822 format used by RSS
-                        pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S %z")
-                    except ValueError:
-                        # Try without timezone
-                        try:
-                            pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S")
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {entry.published}")
+                        pub_date = parsedate_to_datetime(entry['published'])
+                    except (ValueError, TypeError):
+                        logger.warning(f"Could not parse date: {entry['published']}")
                 
                 post = Post(
-                    title=self._clean_content(entry.title),
-                    url=entry.link,
+                    title=self._clean_content(entry['title']),
+                    url=entry['link'],
                     content=cleaned_text,
                     date=pub_date,
                     subtitle='',
@@ -89,6 +90,5 @@ class MediumScraper(BaseScraper):
     @staticmethod
     def _clean_content(content: str) -> str:
         """Remove extra whitespace and normalize text."""
-        # Remove extra whitespace and newlines
-        content = re.sub(r'\s+', ' ', content).strip()
-        return content 
\ No newline at end of file
+        # Collapse runs of whitespace and newlines into single spaces
+        return ' '.join(content.split()) 
\ No newline at end of file
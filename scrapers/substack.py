@@ -2,15 +2,15 @@
 Substack scraper for Writer Context Protocol.
 """
 import logging
-from datetime import datetime
+from email.utils import parsedate_to_datetime
+from itertools import islice
 from typing import List
-import re
 
-import feedparser
 import httpx
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from scrapers.base import BaseScraper, Post
+from scrapers.base import BaseScraper, Post, iter_feed_items
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +30,6 @@ class SubstackScraper(BaseScraper):
             async with httpx.AsyncClient(follow_redirects=True) as client:
                 response = await client.get(f"{self.url}feed")
                 response.raise_for_status()
-                feed = feedparser.parse(response.text)
-                logger.info(f"Number of entries in feed: {len(feed.entries)}")
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error: {e}")
             return []
@@ -39,29 +37,31 @@ class SubstackScraper(BaseScraper):
             logger.error(f"Error fetching Substack feed: {str(e)}")
             return []
 
+        try:
+            entries = list(islice(iter_feed_items(response.content), self.max_posts))
+        except etree.XMLSyntaxError as e:
+            logger.error(f"Error parsing Substack feed: {str(e)}")
+            return []
+        logger.info(f"Number of entries in feed: {len(entries)}")
+
         posts = []
-        for entry in feed.entries[:self.max_posts]:
+        for entry in entries:
             try:
-                content = entry.content[0].value if 'content' in entry else entry.summary
-                soup = BeautifulSoup(content, 'html.parser')
+                soup = BeautifulSoup(entry['content'] or '', 'lxml')
                 cleaned_text = self._clean_content(soup.get_text(separator=' ', strip=True))
                 
                 # Parse date
                 pub_date = None
-                if hasattr(entry, 'published'):
+                if entry['published']:
                     try:
                         # RFC 2822 format used by RSS
-                        pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S %z")
-                    except ValueError:
-                        # Try without timezone
-                        try:
-                            pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S")
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {entry.published}")
+                        pub_date = parsedate_to_datetime(entry['published'])
+                    except (ValueError, TypeError):
+                        logger.warning(f"Could not parse date: {entry['published']}")
                 
                 post = Post(
-                    title=self._clean_content(entry.title),
-                    url=entry.link,
+                    title=self._clean_content(entry['title']),
+                    url=entry['link'],
                     content=cleaned_text,
                     date=pub_date,
                     subtitle="",
@@ -76,6 +76,5 @@ class SubstackScraper(BaseScraper):
     @staticmethod
     def _clean_content(content: str) -> str:
         """Remove extra whitespace and normalize text."""
-        # Remove extra whitespace and newlines
-        content = re.sub(r'\s+', ' ', content).strip()
-        return content 
\ No newline at end of file
+        # Collapse runs of whitespace and newlines into single spaces
+        return ' '.join(content.split()) 
\ No newline at end of file
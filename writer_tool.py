@@ -8,19 +8,31 @@ import asyncio
 import json
 import logging
 import os
-import hashlib
+import pickle
+import threading
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
+from platform import machine
 from typing import Dict, List, Optional, Any, Tuple
 
 import httpx
-import feedparser
 from bs4 import BeautifulSoup
+from lxml import etree
 from mcp.server.fastmcp import FastMCP
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from diskcache import Cache
 
+from posts import Post
+from scrapers.base import FEED_PARSER_OPTIONS, feed_entries
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard json module
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,73 +47,74 @@ mcp = FastMCP("writer-tool")
 cache_dir = Path(".cache")
 os.makedirs(cache_dir, exist_ok=True)
 posts_cache = Cache(str(cache_dir / "posts"))
-embeddings_cache = Cache(str(cache_dir / "embeddings"))
+
+# In-memory copy of every cached post by ID; diskcache is only read to populate it
+posts_by_id = None  # Lazy-loaded when needed
+
+# Key holding every cached post ID (as an insertion-ordered dict), so listing posts needs no key scan
+ALL_POST_IDS_KEY = "__all_post_ids__"
+
+# Key recording which hash the cached post IDs were generated with
+POST_ID_SCHEME_KEY = "__post_id_scheme__"
+POST_ID_SCHEME = "blake2b-128"
+
+# Packed embedding matrix (raw float16 rows, one normalized row per post) and its post ID -> row index.
+# The row count lives in the index, so new rows are simply appended to the file.
+embeddings_path = cache_dir / "embeddings.f16"
+embeddings_index_path = cache_dir / "embeddings_index.json"
+embedding_matrix = None  # Memory-mapped lazily from embeddings_path
+embedding_index = None
 
 # Initialize the embedding model
+EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
 model = None  # Lazy-loaded when needed
+model_lock = threading.Lock()
+embeddings_lock = threading.Lock()
+
+# int8-quantized ONNX exports published with the model, by CPU architecture
+QUANTIZED_MODEL_FILES = {
+    'x86_64': 'onnx/model_quint8_avx2.onnx',
+    'amd64': 'onnx/model_quint8_avx2.onnx',
+    'arm64': 'onnx/model_qint8_arm64.onnx',
+    'aarch64': 'onnx/model_qint8_arm64.onnx',
+}
+
+# Number of texts encoded per forward pass of the embedding model
+EMBEDDING_BATCH_SIZE = 32
+
+# Shared HTTP client settings for fetching platform feeds
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_TIMEOUT = 30
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
 
-# Define Post class for storing article data
-class Post:
-    def __init__(self, title, url, content, date=None, subtitle="", platform="", platform_name=""):
-        self.title = title
-        self.url = url
-        self.content = content
-        self.date = date
-        self.subtitle = subtitle
-        self.word_count = len(content.split()) if content else 0
-        self.platform = platform
-        self.platform_name = platform_name
-        
-        # Generate a unique ID for this post based on URL and title
-        self.id = hashlib.md5(f"{url}:{title}".encode()).hexdigest()
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert the Post object to a dictionary for serialization."""
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url, 
-            'content': self.content,
-            'date': self.date.isoformat() if self.date else None,
-            'subtitle': self.subtitle,
-            'word_count': self.word_count,
-            'platform': self.platform,
-            'platform_name': self.platform_name
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'Post':
-        """Create a Post object from a dictionary."""
-        post = cls(
-            title=data['title'],
-            url=data['url'],
-            content=data['content'],
-            subtitle=data.get('subtitle', ''),
-            platform=data.get('platform', ''),
-            platform_name=data.get('platform_name', '')
-        )
-        
-        if data.get('date'):
-            post.date = datetime.fromisoformat(data['date'])
-        
-        post.id = data.get('id', post.id)
-        post.word_count = data.get('word_count', post.word_count)
-        
-        return post
+
+def write_json(path: Path, data: Any, indent: bool = False) -> None:
+    """Write data to a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2 if indent else None)
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load configuration from config.json file."""
+    """Load configuration from config.json file (read once and cached for the process)."""
     config_path = Path("config.json")
     example_path = Path("config.example.json")
     
     if not config_path.exists():
         if example_path.exists():
             logger.warning("config.json not found, copying from example...")
-            with open(example_path, 'r') as f:
-                example_config = json.load(f)
-            with open(config_path, 'w') as f:
-                json.dump(example_config, f, indent=2)
+            example_config = read_json(example_path)
+            write_json(config_path, example_config, indent=True)
         else:
             logger.error("No config.json or config.example.json found")
             return {
@@ -111,55 +124,66 @@ def load_config() -> Dict[str, Any]:
                 "similar_posts_count": 10  # Default to 10 if not specified
             }
     
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    return read_json(config_path)
+
+
+async def stream_feed_items(client: httpx.AsyncClient, url: str, max_items: int) -> List[Dict[str, Optional[str]]]:
+    """Download an RSS feed and parse its <item> entries incrementally as bytes arrive."""
+    items = []
+    parser = etree.XMLPullParser(**FEED_PARSER_OPTIONS)
+    
+    try:
+        async with client.stream("GET", url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.feed(chunk)
+                items.extend(feed_entries(parser.read_events()))
+                
+                # Stop downloading once we have enough posts
+                if len(items) >= max_items:
+                    return items[:max_items]
+        
+        parser.close()
+    except etree.XMLSyntaxError as e:
+        logger.warning(f"Malformed feed at {url}, keeping the {len(items)} items parsed before the error: {str(e)}")
+    
+    items.extend(feed_entries(parser.read_events()))
+    return items[:max_items]
 
 
-async def fetch_substack_posts(url: str, max_posts: int, platform_name: str) -> List[Post]:
+async def fetch_substack_posts(client: httpx.AsyncClient, url: str, max_posts: int, platform_name: str) -> List[Post]:
     """Fetch posts from a Substack blog."""
     try:
         logger.info(f"Fetching Substack posts from: {url}")
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-            # Ensure URL ends with slash
-            if not url.endswith("/"):
-                url += "/"
-                
-            response = await client.get(f"{url}feed")
-            response.raise_for_status()
-            feed = feedparser.parse(response.text)
-            logger.info(f"Found {len(feed.entries)} posts")
+        # Ensure URL ends with slash
+        if not url.endswith("/"):
+            url += "/"
+            
+        entries = await stream_feed_items(client, f"{url}feed", max_posts)
+        logger.info(f"Found {len(entries)} posts")
     except Exception as e:
         logger.error(f"Error fetching Substack feed: {str(e)}")
         return []
 
     posts = []
-    for entry in feed.entries[:max_posts]:
+    for entry in entries:
         try:
             # Extract content
-            content = entry.content[0].value if 'content' in entry else entry.summary
-            soup = BeautifulSoup(content, 'html.parser')
+            soup = BeautifulSoup(entry['content'] or '', 'lxml')
             clean_content = soup.get_text(separator=' ', strip=True)
             
             # Parse date
             pub_date = None
-            if hasattr(entry, 'published'):
+            if entry['published']:
                 try:
-                    # Try parsing in RFC 2822 format which includes timezone (standard for RSS feeds)
-                    from email.utils import parsedate_to_datetime
-                    pub_date = parsedate_to_datetime(entry.published)
-                except (ValueError, TypeError) as e:
-                    # Fall back to other formats if the RFC 2822 parser fails
-                    try:
-                        pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S %Z")
-                    except ValueError:
-                        try:
-                            pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S")
-                        except ValueError:
-                            logger.warning(f"Could not parse date: {entry.published}")
+                    # RFC 2822 format used by RSS
+                    pub_date = parsedate_to_datetime(entry['published'])
+                except (ValueError, TypeError):
+                    logger.warning(f"Could not parse date: {entry['published']}")
             
             post = Post(
-                title=entry.title,
-                url=entry.link,
+                title=entry['title'],
+                url=entry['link'],
                 content=clean_content,
                 date=pub_date,
                 platform="substack",
@@ -173,7 +197,7 @@ async def fetch_substack_posts(url: str, max_posts: int, platform_name: str) ->
     return posts
 
 
-async def fetch_medium_posts(url: str, max_posts: int, platform_name: str) -> List[Post]:
+async def fetch_medium_posts(client: httpx.AsyncClient, url: str, max_posts: int, platform_name: str) -> List[Post]:
     """Fetch posts from a Medium blog."""
     # Extract username from URL
     username = url.split('@')[-1].split('/')[0] if '@' in url else url.split('/')[-1]
@@ -181,39 +205,31 @@ async def fetch_medium_posts(url: str, max_posts: int, platform_name: str) -> Li
     
     try:
         logger.info(f"Fetching Medium posts from: {rss_url}")
-        async with httpx.AsyncClient() as client:
-            response = await client.get(rss_url)
-            response.raise_for_status()
-            feed = feedparser.parse(response.text)
-            logger.info(f"Found {len(feed.entries)} posts")
+        entries = await stream_feed_items(client, rss_url, max_posts)
+        logger.info(f"Found {len(entries)} posts")
     except Exception as e:
         logger.error(f"Error fetching Medium feed: {str(e)}")
         return []
 
     posts = []
-    for entry in feed.entries[:max_posts]:
+    for entry in entries:
         try:
             # Extract content
-            soup = BeautifulSoup(entry.content[0].value, 'html.parser')
+            soup = BeautifulSoup(entry['content'] or '', 'lxml')
             clean_content = soup.get_text(separator=' ', strip=True)
             
             # Parse date
             pub_date = None
-            if hasattr(entry, 'published'):
+            if entry['published']:
                 try:
-                    # Try parsing in RFC 2822 format which includes timezone (standard for RSS feeds)
-                    from email.utils import parsedate_to_datetime
-                    pub_date = parsedate_to_datetime(entry.published)
+                    # RFC 2822 format used by RSS
+                    pub_date = parsedate_to_datetime(entry['published'])
                 except (ValueError, TypeError):
-                    # Fall back to other formats if the RFC 2822 parser fails
-                    try:
-                        pub_date = datetime.strptime(entry.published, "%a, %d %b %Y %H:%M:%S %Z")
-                    except ValueError:
-                        logger.warning(f"Could not parse date: {entry.published}")
+                    logger.warning(f"Could not parse date: {entry['published']}")
             
             post = Post(
-                title=entry.title,
-                url=entry.link,
+                title=entry['title'],
+                url=entry['link'],
                 content=clean_content,
                 date=pub_date,
                 platform="medium",
@@ -228,24 +244,117 @@ async def fetch_medium_posts(url: str, max_posts: int, platform_name: str) -> Li
 
 
 def get_embedding_model():
-    """Lazy-load the embedding model when needed."""
+    """Lazy-load the embedding model when needed. Safe to call from worker threads."""
     global model
-    if model is None:
-        logger.info("Loading embedding model...")
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        logger.info("Embedding model loaded")
+    with model_lock:
+        if model is None:
+            logger.info("Loading embedding model...")
+            model = load_embedding_model()
+            logger.info("Embedding model loaded")
     return model
 
 
+def load_embedding_model() -> SentenceTransformer:
+    """Load the int8-quantized ONNX model, falling back to the default PyTorch backend."""
+    file_name = QUANTIZED_MODEL_FILES.get(machine().lower())
+    if file_name:
+        try:
+            return SentenceTransformer(EMBEDDING_MODEL_NAME, backend="onnx", model_kwargs={"file_name": file_name})
+        except Exception as e:
+            logger.warning(f"Could not load quantized ONNX model, using the default backend: {str(e)}")
+    
+    return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+
 def calculate_embedding(text: str) -> np.ndarray:
     """Calculate embeddings for a piece of text."""
+    return calculate_embeddings([text])[0]
+
+
+def calculate_embeddings(texts: List[str]) -> np.ndarray:
+    """Calculate normalized embeddings for a batch of texts in one encode call."""
     model = get_embedding_model()
     # Truncate to avoid extremely long texts
     max_length = 10000
-    if len(text) > max_length:
-        text = text[:max_length]
+    texts = [text[:max_length] for text in texts]
+    
+    return model.encode(
+        texts,
+        batch_size=EMBEDDING_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
+
+def load_embeddings() -> Tuple[Optional[np.ndarray], Dict[str, int]]:
+    """Memory-map the packed embedding matrix and load its post ID -> row index."""
+    global embedding_matrix, embedding_index
+    if embedding_index is None:
+        embedding_index = {}
+        if embeddings_path.exists() and embeddings_index_path.exists():
+            index = read_json(embeddings_index_path)
+            row_bytes = embeddings_path.stat().st_size / max(len(index), 1)
+            
+            if index and row_bytes.is_integer() and row_bytes % 2 == 0:
+                embedding_index = index
+            elif index:
+                logger.warning("Embedding index does not match the embedding matrix, rebuilding")
+    
+    if embedding_matrix is None and embedding_index:
+        dim = embeddings_path.stat().st_size // (len(embedding_index) * 2)
+        embedding_matrix = np.memmap(embeddings_path, dtype=np.float16, mode='r', shape=(len(embedding_index), dim))
+    
+    return embedding_matrix, embedding_index
+
+
+def append_embeddings(post_ids: List[str], embeddings: np.ndarray) -> None:
+    """Append rows for new posts to the packed embedding matrix and persist it."""
+    global embedding_matrix
+    matrix, index = load_embeddings()
+    rows = np.ascontiguousarray(embeddings, dtype=np.float16)
+    if matrix is not None and matrix.shape[1] != rows.shape[1]:
+        raise ValueError(
+            f"Embedding size changed from {matrix.shape[1]} to {rows.shape[1]}; "
+            f"delete {embeddings_path} and {embeddings_index_path} to re-embed all posts"
+        )
+    
+    # Release the memory map before writing; Windows refuses to modify a mapped file
+    matrix = embedding_matrix = None
+    
+    # Start a new file when there is no valid index to append to
+    with open(embeddings_path, 'ab' if index else 'wb') as f:
+        f.write(rows.tobytes())
     
-    return model.encode(text)
+    index = dict(index)
+    for post_id in post_ids:
+        index[post_id] = len(index)
+    save_embedding_index(index)
+
+
+def save_embedding_index(index: Dict[str, int]) -> None:
+    """Persist the post ID -> row index of the packed embedding matrix."""
+    global embedding_index
+    tmp_path = embeddings_index_path.with_suffix(".tmp")
+    write_json(tmp_path, index)
+    os.replace(tmp_path, embeddings_index_path)
+    
+    embedding_index = index
+
+
+def embed_posts(posts: List[Post]) -> int:
+    """Generate and store embeddings for any posts that don't have one yet."""
+    with embeddings_lock:
+        _, index = load_embeddings()
+        missing = list({post.id: post for post in posts if post.id not in index}.values())
+        if not missing:
+            return 0
+        
+        logger.info(f"Generating embeddings for {len(missing)} posts")
+        embeddings = calculate_embeddings([post.title + " " + post.content[:5000] for post in missing])
+        append_embeddings([post.id for post in missing], embeddings)
+    
+    return len(missing)
 
 
 def find_similar_posts(query: str, all_posts: List[Post], top_n: int = 10) -> List[Tuple[Post, float]]:
@@ -260,28 +369,26 @@ def find_similar_posts(query: str, all_posts: List[Post], top_n: int = 10) -> Li
     
     query_embedding = calculate_embedding(query)
     
-    results = []
-    for post in all_posts:
-        # Check if we have a cached embedding
-        cached_embedding = None
-        if post.id in embeddings_cache:
-            cached_embedding = embeddings_cache[post.id]
-        
-        if cached_embedding is None:
-            # Calculate and cache the embedding
-            embedding = calculate_embedding(post.title + " " + post.content[:5000])
-            embeddings_cache[post.id] = embedding
-        else:
-            embedding = cached_embedding
-        
-        # Calculate similarity (cosine similarity)
-        similarity = np.dot(query_embedding, embedding) / (np.linalg.norm(query_embedding) * np.linalg.norm(embedding))
-        results.append((post, float(similarity)))
+    # Calculate and store any missing embeddings in one batch
+    embed_posts(all_posts)
     
-    # Sort by similarity (highest first)
-    results.sort(key=lambda x: x[1], reverse=True)
+    # Rows and query are normalized, so cosine similarity is one matrix-vector product
+    matrix, index = load_embeddings()
+    rows = [index[post.id] for post in all_posts]
+    scores = matrix[rows].astype(np.float32) @ query_embedding
+    
+    # Pick the top_n scores without sorting the whole list, then order them (highest first)
+    k = min(top_n, scores.size)
+    if k <= 0:
+        return []
+    if k < scores.size:
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+    else:
+        # Every post is returned, so partitioning first would only add a pass
+        top = np.argsort(-scores)
     
-    return results[:top_n]
+    return [(all_posts[i], float(scores[i])) for i in top]
 
 
 async def get_all_content(refresh: bool = False) -> Dict[str, List[Post]]:
@@ -315,47 +422,64 @@ async def get_all_content(refresh: bool = False) -> Dict[str, List[Post]]:
             # Load posts from cache based on cache key
             platform_post_ids = posts_cache.get(f"{cache_key}:post_ids", [])
             platform_posts = []
+            cached_posts = load_posts()
             
             for post_id in platform_post_ids:
-                post_data = posts_cache.get(f"post:{post_id}")
-                if post_data:
-                    post = Post.from_dict(post_data)
+                post = cached_posts.get(post_id)
+                if post:
                     platform_posts.append(post)
                     post_sources[post_id] = cache_key
             
             results[platform_name] = platform_posts
     
-    # Fetch content for platforms that need updating
-    for platform_type, platform_url, platform_name, cache_key in platforms_to_fetch:
-        try:
-            max_posts = config.get("max_posts", 100)  # Default to higher limit
+    # Fetch content for platforms that need updating, concurrently over one pooled client
+    max_posts = config.get("max_posts", 100)  # Default to higher limit
+    fetched = []
+    fetch_results = []
+    if platforms_to_fetch:
+        async with httpx.AsyncClient(follow_redirects=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT) as client:
+            fetches = []
+            for platform_type, platform_url, platform_name, cache_key in platforms_to_fetch:
+                if platform_type == "substack":
+                    fetch = fetch_substack_posts(client, platform_url, max_posts, platform_name)
+                elif platform_type == "medium":
+                    fetch = fetch_medium_posts(client, platform_url, max_posts, platform_name)
+                else:
+                    logger.warning(f"Unknown platform type: {platform_type}")
+                    continue
+                
+                fetched.append((platform_type, platform_name, cache_key))
+                fetches.append(fetch)
             
-            if platform_type == "substack":
-                posts = await fetch_substack_posts(platform_url, max_posts, platform_name)
-            elif platform_type == "medium":
-                posts = await fetch_medium_posts(platform_url, max_posts, platform_name)
-            else:
-                logger.warning(f"Unknown platform type: {platform_type}")
-                continue
+            fetch_results = await asyncio.gather(*fetches, return_exceptions=True)
+    
+    for (platform_type, platform_name, cache_key), posts in zip(fetched, fetch_results):
+        try:
+            if isinstance(posts, BaseException):
+                raise posts
             
-            # Update cache
-            post_ids = []
-            for post in posts:
-                post_id = post.id
-                post_ids.append(post_id)
-                post_sources[post_id] = cache_key
+            # Update cache, writing all of this platform's posts in one SQLite transaction
+            with posts_cache.transact():
+                post_ids = []
+                for post in posts:
+                    post_id = post.id
+                    post_ids.append(post_id)
+                    post_sources[post_id] = cache_key
+                    
+                    # Cache the post (diskcache pickles the Post object directly)
+                    posts_cache[f"post:{post_id}"] = post
+                    if posts_by_id is not None:
+                        posts_by_id[post_id] = post
+                    
+                    # Mark as new/changed post
+                    new_posts[post_id] = post
                 
-                # Cache the post
-                posts_cache[f"post:{post_id}"] = post.to_dict()
+                # Update the list of post IDs for this platform and the global index
+                posts_cache[f"{cache_key}:post_ids"] = post_ids
+                posts_cache[ALL_POST_IDS_KEY] = {**load_post_ids(), **dict.fromkeys(post_ids)}
                 
-                # Mark as new/changed post
-                new_posts[post_id] = post
-            
-            # Update the list of post IDs for this platform
-            posts_cache[f"{cache_key}:post_ids"] = post_ids
-            
-            # Update the last fetch time
-            posts_cache[f"{cache_key}:last_fetch_time"] = now
+                # Update the last fetch time
+                posts_cache[f"{cache_key}:last_fetch_time"] = now
             
             results[platform_name] = posts
             
@@ -364,41 +488,116 @@ async def get_all_content(refresh: bool = False) -> Dict[str, List[Post]]:
             # Try to load from cache if available
             platform_post_ids = posts_cache.get(f"{cache_key}:post_ids", [])
             platform_posts = []
+            cached_posts = load_posts()
             
             for post_id in platform_post_ids:
-                post_data = posts_cache.get(f"post:{post_id}")
-                if post_data:
-                    post = Post.from_dict(post_data)
+                post = cached_posts.get(post_id)
+                if post:
                     platform_posts.append(post)
             
             if platform_posts:
                 results[platform_name] = platform_posts
     
-    # Generate embeddings for new/changed posts
-    for post_id, post in new_posts.items():
-        if post_id not in embeddings_cache:
-            # Generate and cache the embedding
-            logger.info(f"Generating embedding for: {post.title}")
-            embedding = calculate_embedding(post.title + " " + post.content[:5000])
-            embeddings_cache[post_id] = embedding
+    # Generate embeddings for new/changed posts without blocking the event loop
+    await asyncio.to_thread(embed_posts, list(new_posts.values()))
     
     return results
 
 
+def read_cached_post(key: str) -> Optional[Post]:
+    """Read one post from the cache, skipping entries that can no longer be unpickled."""
+    try:
+        post = posts_cache.get(key)
+    except (pickle.UnpicklingError, AttributeError, ImportError, EOFError) as e:
+        # e.g. posts pickled as __main__.Post before Post moved to its own module;
+        # the next refresh of their platform caches them again
+        logger.warning(f"Skipping unreadable cached post {key}: {str(e)}")
+        return None
+    
+    if isinstance(post, dict):
+        # Posts cached by older versions were stored as dictionaries
+        post = Post.from_dict(post)
+    return post
+
+
+def load_post_ids() -> Dict[str, None]:
+    """Return the index of every cached post ID, building it on first use."""
+    post_ids = posts_cache.get(ALL_POST_IDS_KEY)
+    if post_ids is None:
+        # Build the index once for caches written before it existed
+        post_ids = dict.fromkeys(key.split(":", 1)[1] for key in posts_cache if key.startswith("post:"))
+        posts_cache[ALL_POST_IDS_KEY] = post_ids
+    
+    return post_ids
+
+
+def load_posts() -> Dict[str, Post]:
+    """Lazy-load every cached post into memory, keyed by post ID."""
+    global posts_by_id
+    if posts_by_id is None:
+        # Find all post IDs that we have cached
+        post_ids = load_post_ids()
+        
+        # Read every post under one SQLite transaction instead of one per lookup
+        with posts_cache.transact():
+            posts_by_id = {}
+            for post_id in post_ids:
+                post = read_cached_post(f"post:{post_id}")
+                if post:
+                    posts_by_id[post_id] = post
+    
+    return posts_by_id
+
+
+def migrate_post_ids() -> None:
+    """Re-key posts cached under older ID schemes (MD5) to the current one, once."""
+    if posts_cache.get(POST_ID_SCHEME_KEY) == POST_ID_SCHEME:
+        return
+    
+    # Move each post to its new key, all within one SQLite transaction
+    renamed = {}
+    with posts_cache.transact():
+        for key in list(posts_cache):
+            if not key.startswith("post:"):
+                continue
+            post = read_cached_post(key)
+            if not post:
+                # The key exists, so the entry can't be unpickled; drop it for good
+                del posts_cache[key]
+                continue
+            
+            new_id = Post.make_id(post.url, post.title)
+            if post.id != new_id:
+                renamed[post.id] = new_id
+                post.id = new_id
+                del posts_cache[key]
+            posts_cache[f"post:{new_id}"] = post
+        
+        # Rewrite the global index and the per-platform post ID lists
+        if renamed:
+            for key in list(posts_cache):
+                if key == ALL_POST_IDS_KEY:
+                    posts_cache[key] = dict.fromkeys(renamed.get(post_id, post_id) for post_id in posts_cache[key])
+                elif key.endswith(":post_ids"):
+                    posts_cache[key] = [renamed.get(post_id, post_id) for post_id in posts_cache[key]]
+        
+        posts_cache[POST_ID_SCHEME_KEY] = POST_ID_SCHEME
+    
+    if renamed:
+        logger.info(f"Migrated {len(renamed)} cached posts to {POST_ID_SCHEME} IDs")
+        
+        # Embedding rows stay where they are; only their keys change
+        _, index = load_embeddings()
+        new_index = {}
+        for post_id, row in index.items():
+            new_id = renamed.get(post_id, post_id)
+            new_index[post_id if new_id in index else new_id] = row
+        save_embedding_index(new_index)
+
+
 def get_all_posts() -> List[Post]:
     """Get a flat list of all posts from all platforms."""
-    all_posts = []
-    
-    # Find all post IDs that we have cached
-    for key in posts_cache:
-        if key.startswith("post:"):
-            post_id = key.split(":", 1)[1]
-            post_data = posts_cache.get(key)
-            if post_data:
-                post = Post.from_dict(post_data)
-                all_posts.append(post)
-    
-    return all_posts
+    return list(load_posts().values())
 
 
 @mcp.tool()
@@ -408,6 +607,12 @@ async def refresh_content() -> str:
     
     This retrieves the latest posts and updates the cache.
     """
+    global posts_by_id
+    
+    # Pick up any edits to config.json and reload posts from disk
+    load_config.cache_clear()
+    posts_by_id = None
+    
     results = await get_all_content(refresh=True)
     
     total_posts = sum(len(posts) for posts in results.values())
@@ -438,7 +643,7 @@ async def search_writing(query: str) -> str:
     top_n = config.get("similar_posts_count", 10)  # Default to 10 if not specified
     
     # Find similar posts using embeddings
-    similar_posts = find_similar_posts(query, all_posts, top_n=top_n)
+    similar_posts = await asyncio.to_thread(find_similar_posts, query, all_posts, top_n=top_n)
     
     if not similar_posts:
         return f"No relevant matches found for '{query}'"
@@ -452,9 +657,8 @@ async def search_writing(query: str) -> str:
     
     for i, (post, score) in enumerate(similar_posts, 1):
         resource_uri = f"mcp://writer-tool/essay/{post.id}"
-        date_str = post.date.strftime("%b %d, %Y") if post.date else "Unknown date"
         
-        response += f"{i}. **[{post.title}]({resource_uri})** - {date_str} - Relevance: {score:.2f}\n"
+        response += f"{i}. **[{post.title}]({resource_uri})** - {post.date_display} - Relevance: {score:.2f}\n"
         response += f"   Source: [{post.platform_name}]({post.url})\n"
         response += f"   Words: {post.word_count}\n\n"
     
@@ -467,15 +671,14 @@ async def search_writing(query: str) -> str:
         top_post, top_score = similar_posts[0]
         response += "## Preview of Top Result\n\n"
         response += f"### {top_post.title}\n"
-        date_str = top_post.date.strftime("%b %d, %Y") if top_post.date else "Unknown date"
-        response += f"Date: {date_str} | [Original Link]({top_post.url})\n\n"
+        response += f"Date: {top_post.date_display} | [Original Link]({top_post.url})\n\n"
         
         # Extract a snippet around where the query appears, if possible
-        content = top_post.content.lower()
+        content = top_post.content_lower
         query_lower = query.lower()
+        index = content.find(query_lower)
         
-        if query_lower in content:
-            index = content.find(query_lower)
+        if index != -1:
             start = max(0, index - 100)
             end = min(len(content), index + len(query_lower) + 100)
             
@@ -488,8 +691,9 @@ async def search_writing(query: str) -> str:
             response += f"{snippet}\n\n"
         else:
             # Just show the beginning of the content
-            preview = ' '.join(top_post.content.split()[:150])
-            if len(top_post.content.split()) > 150:
+            words = top_post.content.split()
+            preview = ' '.join(words[:150])
+            if len(words) > 150:
                 preview += "... (content continues)"
             
             response += f"{preview}\n\n"
@@ -506,18 +710,23 @@ async def preload_all_content():
     """
     logger.info("Preloading all content and generating embeddings...")
     
-    # Force refresh all content
-    results = await get_all_content(refresh=True)
+    # Bring caches written by older versions up to date before fetching
+    migrate_post_ids()
+    
+    # Load the embedding model in a worker thread while feeds are being fetched
+    model_loading = asyncio.create_task(asyncio.to_thread(get_embedding_model))
+    
+    # Force refresh all content; always collect the model task so its errors aren't lost
+    try:
+        results = await get_all_content(refresh=True)
+    finally:
+        await model_loading
     
     # Get all posts
     all_posts = get_all_posts()
     
     # Generate embeddings for all posts
-    for post in all_posts:
-        if post.id not in embeddings_cache:
-            logger.info(f"Generating embedding for: {post.title}")
-            embedding = calculate_embedding(post.title + " " + post.content[:5000])
-            embeddings_cache[post.id] = embedding
+    await asyncio.to_thread(embed_posts, all_posts)
     
     total_posts = sum(len(posts) for posts in results.values())
     platforms = ", ".join(results.keys())
@@ -539,10 +748,8 @@ if __name__ == "__main__":
         
         for post in all_posts:
             post_uri = f"mcp://writer-tool/essay/{post.id}"
-            # Format date properly for description
-            date_str = post.date.strftime("%b %d, %Y") if post.date else "Unknown date"
             # Create a clean description without showing the raw URI
-            description = f"{post.platform_name} - {date_str}"
+            description = f"{post.platform_name} - {post.date_display}"
             
             resources.append({
                 "uri": post_uri,
@@ -557,18 +764,16 @@ if __name__ == "__main__":
     @mcp.resource(r"mcp://writer-tool/essay/{post_id}")
     async def essay(post_id: str) -> str:
         """Return a specific essay."""
-        post_data = posts_cache.get(f"post:{post_id}")
+        post = load_posts().get(post_id)
         
-        if not post_data:
+        if not post:
             return f"Essay with ID {post_id} not found."
         
-        post = Post.from_dict(post_data)
-        
         # Format as markdown
         markdown = f"# {post.title}\n\n"
         
         if post.date:
-            markdown += f"Date: {post.date.strftime('%b %d, %Y')}\n\n"
+            markdown += f"Date: {post.date_display}\n\n"
         
         markdown += f"Source: [{post.platform_name}]({post.url})\n\n"
         markdown += f"Word count: {post.word_count}\n\n"
@@ -585,9 +790,8 @@ if __name__ == "__main__":
         markdown = "# Your Essays\n\n"
         
         for post in all_posts:
-            date_str = post.date.strftime("%b %d, %Y") if post.date else "Unknown date"
             # Use the title as the clickable link text without showing the URI
-            markdown += f"- [{post.title}](mcp://writer-tool/essay/{post.id}) - {date_str} - {post.platform_name}\n"
+            markdown += f"- [{post.title}](mcp://writer-tool/essay/{post.id}) - {post.date_display} - {post.platform_name}\n"
         
         return markdown
     